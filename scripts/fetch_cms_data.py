@@ -6,15 +6,20 @@ Downloads the monthly ZIP file from CMS containing enrollment data
 by Contract/Plan/State/County.
 """
 
+import json
 import os
 import re
+import shutil
 import sys
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # CMS data page URL
 CMS_DATA_PAGE = "https://www.cms.gov/data-research/statistics-trends-and-reports/medicare-advantagepart-d-contract-and-enrollment-data/monthly-enrollment-contract/plan/state/county"
@@ -23,10 +28,30 @@ CMS_DATA_PAGE = "https://www.cms.gov/data-research/statistics-trends-and-reports
 # Example: CPSC_Enrollment_Info_2024_01.zip
 CMS_DOWNLOAD_BASE = "https://www.cms.gov/files/zip"
 
+# Downloads are spooled in memory up to this size, then spill to disk
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
 # Data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
 RAW_DIR = DATA_DIR / "raw"
 
+# Shared session so probes and downloads reuse the connection to www.cms.gov,
+# retrying transient server errors with exponential backoff
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=['GET', 'HEAD'],
+    ),
+    pool_connections=4,
+    pool_maxsize=8,
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
 
 def get_current_data_month():
     """
@@ -87,26 +112,58 @@ def fetch_cpsc_data(year: int, month: int, output_dir: Path = None) -> Path:
 
     zip_data = None
     successful_url = None
+    download_response = None
+
+    # Skip the download entirely if CMS reports the file unchanged
+    output_path = output_dir / f"cpsc_enrollment_{year}_{month_str}.csv"
+    meta_path = output_dir / f"cpsc_enrollment_{year}_{month_str}.meta.json"
+    cache_meta = load_cache_meta(meta_path) if output_path.exists() else None
 
-    for filename in possible_filenames:
-        url = f"{CMS_DOWNLOAD_BASE}/{filename}"
-        print(f"Trying: {url}")
+    if cache_meta:
+        headers = {}
+        if cache_meta.get('etag'):
+            headers['If-None-Match'] = cache_meta['etag']
+        if cache_meta.get('last_modified'):
+            headers['If-Modified-Since'] = cache_meta['last_modified']
 
+        print(f"Checking for updates: {cache_meta['url']}")
         try:
-            response = requests.get(url, timeout=60)
+            response = SESSION.get(cache_meta['url'], headers=headers, timeout=60, stream=True)
+            if response.status_code == 304:
+                print(f"Not modified since last download, using: {output_path}")
+                return output_path
             if response.status_code == 200:
-                zip_data = response.content
-                successful_url = url
-                print(f"Successfully downloaded from: {url}")
-                break
+                zip_data = download_to_tempfile(response)
+                successful_url = cache_meta['url']
+                download_response = response
+                print(f"Successfully downloaded from: {successful_url}")
+            else:
+                # e.g. 404/410 if the file moved; release the pooled connection
+                response.close()
         except requests.RequestException as e:
             print(f"  Failed: {e}")
-            continue
+
+    if zip_data is None:
+        urls = [f"{CMS_DOWNLOAD_BASE}/{filename}" for filename in possible_filenames]
+        successful_url = probe_urls(urls)
+
+    if zip_data is None and successful_url:
+        try:
+            response = SESSION.get(successful_url, timeout=60, stream=True)
+            if not response.ok:
+                response.close()
+            response.raise_for_status()
+            zip_data = download_to_tempfile(response)
+            download_response = response
+            print(f"Successfully downloaded from: {successful_url}")
+        except requests.RequestException as e:
+            print(f"  Failed: {e}")
+            successful_url = None
 
     if zip_data is None:
         # Try fetching the page to find the actual download link
         print(f"Direct downloads failed. Attempting to parse CMS page...")
-        zip_data, successful_url = fetch_from_cms_page(year, month)
+        zip_data, successful_url, download_response = fetch_from_cms_page(year, month)
 
     if zip_data is None:
         raise RuntimeError(
@@ -115,19 +172,107 @@ def fetch_cpsc_data(year: int, month: int, output_dir: Path = None) -> Path:
         )
 
     # Extract the ZIP file
-    csv_path = extract_zip(zip_data, output_dir, year, month)
+    with zip_data:
+        csv_path = extract_zip(zip_data, output_dir, year, month)
+
+    if download_response is not None:
+        save_cache_meta(meta_path, successful_url, download_response)
+
     return csv_path
 
 
+def probe_urls(urls: list) -> str:
+    """
+    Probe candidate URLs concurrently with HEAD requests.
+
+    Returns as soon as any candidate answers 200, without waiting on the
+    rest. If several exist, whichever responds first wins, not list order.
+
+    Returns:
+        The first URL to respond with 200, or None if none did
+    """
+    ex = ThreadPoolExecutor(max_workers=len(urls))
+    futures = {
+        ex.submit(SESSION.head, url, timeout=10, allow_redirects=True): url
+        for url in urls
+    }
+
+    try:
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                response = future.result()
+            except requests.RequestException as e:
+                print(f"Trying: {url}\n  Failed: {e}")
+                continue
+
+            print(f"Trying: {url} ({response.status_code})")
+            if response.status_code == 200:
+                return url
+    finally:
+        # Don't block on the remaining probes once a hit is found
+        ex.shutdown(wait=False, cancel_futures=True)
+
+    return None
+
+
+def download_to_tempfile(response: requests.Response):
+    """
+    Stream a response body into a spooled temporary file.
+
+    Returns:
+        File object positioned at the start of the downloaded data
+    """
+    tmp = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+        tmp.write(chunk)
+    tmp.seek(0)
+    return tmp
+
+
+def load_cache_meta(meta_path: Path) -> dict:
+    """
+    Load the cached ETag/Last-Modified headers from a previous download.
+
+    Returns:
+        Dict with url, etag and last_modified, or None if unavailable
+    """
+    if not meta_path.exists():
+        return None
+
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not meta.get('url') or not (meta.get('etag') or meta.get('last_modified')):
+        return None
+
+    return meta
+
+
+def save_cache_meta(meta_path: Path, url: str, response: requests.Response):
+    """Save the response validators so the next run can send a conditional GET."""
+    meta = {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+
+
 def fetch_from_cms_page(year: int, month: int):
     """
     Attempt to find and download the data file by parsing the CMS page.
 
     Returns:
-        Tuple of (zip_data bytes, url) or (None, None) if not found
+        Tuple of (zip_data file object, url, response) or (None, None, None)
+        if not found
     """
     try:
-        response = requests.get(CMS_DATA_PAGE, timeout=30)
+        response = SESSION.get(CMS_DATA_PAGE, timeout=30)
         response.raise_for_status()
 
         # Look for ZIP file links in the page
@@ -150,26 +295,30 @@ def fetch_from_cms_page(year: int, month: int):
 
                 print(f"Found potential link: {url}")
                 try:
-                    zip_response = requests.get(url, timeout=60)
+                    zip_response = SESSION.get(url, timeout=60, stream=True)
                     if zip_response.status_code == 200:
-                        return zip_response.content, url
+                        return download_to_tempfile(zip_response), url, zip_response
+                    zip_response.close()
                 except requests.RequestException:
                     continue
 
     except requests.RequestException as e:
         print(f"Could not fetch CMS page: {e}")
 
-    return None, None
+    return None, None, None
 
 
-def extract_zip(zip_data: bytes, output_dir: Path, year: int, month: int) -> Path:
+def extract_zip(zip_data, output_dir: Path, year: int, month: int) -> Path:
     """
     Extract the CSV files from the ZIP file.
 
+    Args:
+        zip_data: Seekable file object containing the ZIP archive
+
     Returns:
         Path to the extracted enrollment CSV file
     """
-    with zipfile.ZipFile(BytesIO(zip_data)) as zf:
+    with zipfile.ZipFile(zip_data) as zf:
         # Find CSV files in the archive
         csv_files = [f for f in zf.namelist() if f.lower().endswith('.csv')]
 
@@ -199,7 +348,7 @@ def extract_zip(zip_data: bytes, output_dir: Path, year: int, month: int) -> Pat
         output_path = output_dir / output_filename
 
         with zf.open(enrollment_file) as src, open(output_path, 'wb') as dst:
-            dst.write(src.read())
+            shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
         print(f"Saved to: {output_path}")
 
         # Extract contract info file if found
@@ -207,7 +356,7 @@ def extract_zip(zip_data: bytes, output_dir: Path, year: int, month: int) -> Pat
             print(f"Extracting: {contract_file}")
             contract_output = output_dir / f"cpsc_contract_info_{year}_{month:02d}.csv"
             with zf.open(contract_file) as src, open(contract_output, 'wb') as dst:
-                dst.write(src.read())
+                shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
             print(f"Saved to: {contract_output}")
 
         return output_path
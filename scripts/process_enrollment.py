@@ -6,156 +6,100 @@ Parses the CSV file, aggregates enrollment by county/org/plan type,
 and calculates changes from December baseline.
 """
 
+import codecs
 import json
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
 # Data directories
 DATA_DIR = Path(__file__).parent.parent / "data"
 RAW_DIR = DATA_DIR / "raw"
 PROCESSED_DIR = DATA_DIR / "processed"
 
-# Parent organization mapping (contract prefix → parent org)
-# Based on major MAOs controlling ~70% of the market
-PARENT_ORG_MAPPING = {
-    # UnitedHealth Group
-    "H0028": "UnitedHealth Group",
-    "H0543": "UnitedHealth Group",
-    "H0754": "UnitedHealth Group",
-    "H1045": "UnitedHealth Group",
-    "H1685": "UnitedHealth Group",
-    "H2001": "UnitedHealth Group",
-    "H2168": "UnitedHealth Group",
-    "H2406": "UnitedHealth Group",
-    "H3749": "UnitedHealth Group",
-    "H4091": "UnitedHealth Group",
-    "H5253": "UnitedHealth Group",
-    "H5521": "UnitedHealth Group",
-    "H6501": "UnitedHealth Group",
-    "H7657": "UnitedHealth Group",
-    "R5826": "UnitedHealth Group",
-
-    # CVS Health (Aetna)
-    "H0112": "CVS Health (Aetna)",
-    "H0318": "CVS Health (Aetna)",
-    "H0485": "CVS Health (Aetna)",
-    "H0533": "CVS Health (Aetna)",
-    "H1609": "CVS Health (Aetna)",
-    "H2478": "CVS Health (Aetna)",
-    "H3152": "CVS Health (Aetna)",
-    "H3312": "CVS Health (Aetna)",
-    "H3597": "CVS Health (Aetna)",
-    "H4002": "CVS Health (Aetna)",
-    "H4448": "CVS Health (Aetna)",
-    "H5521": "CVS Health (Aetna)",
-    "H9851": "CVS Health (Aetna)",
-
-    # Humana
-    "H0028": "Humana",
-    "H1036": "Humana",
-    "H1406": "Humana",
-    "H1951": "Humana",
-    "H2649": "Humana",
-    "H4141": "Humana",
-    "H4461": "Humana",
-    "H5216": "Humana",
-    "H5619": "Humana",
-    "H6622": "Humana",
-    "H7495": "Humana",
-    "H8145": "Humana",
-    "R5826": "Humana",
-
-    # Elevance Health (Anthem)
-    "H0146": "Elevance Health (Anthem)",
-    "H0354": "Elevance Health (Anthem)",
-    "H0540": "Elevance Health (Anthem)",
-    "H2006": "Elevance Health (Anthem)",
-    "H3655": "Elevance Health (Anthem)",
-    "H3905": "Elevance Health (Anthem)",
-    "H4624": "Elevance Health (Anthem)",
-    "H5853": "Elevance Health (Anthem)",
-    "H9019": "Elevance Health (Anthem)",
-
-    # Centene
-    "H0169": "Centene",
-    "H1485": "Centene",
-    "H2712": "Centene",
-    "H3447": "Centene",
-    "H4007": "Centene",
-    "H5427": "Centene",
-    "H6832": "Centene",
-
-    # Kaiser Permanente
-    "H0524": "Kaiser Permanente",
-    "H0630": "Kaiser Permanente",
-    "H2172": "Kaiser Permanente",
-    "H9003": "Kaiser Permanente",
-
-    # Cigna
-    "H0107": "Cigna",
-    "H0354": "Cigna",
-    "H4513": "Cigna",
-    "H5410": "Cigna",
-    "H6373": "Cigna",
-
-    # Molina Healthcare
-    "H0169": "Molina Healthcare",
-    "H0420": "Molina Healthcare",
-    "H5823": "Molina Healthcare",
-    "H9498": "Molina Healthcare",
-
-    # Blue Cross Blue Shield (various)
-    "H0404": "BCBS",
-    "H0520": "BCBS",
-    "H1350": "BCBS",
-    "H2819": "BCBS",
-    "H3949": "BCBS",
-    "H5008": "BCBS",
-    "H6502": "BCBS",
+# Parent organization contracts (contract prefix → parent org)
+# Based on major MAOs controlling ~70% of the market.
+# H0028, H0169, H0354, H5521 and R5826 used to appear under two orgs in a
+# flat dict; each is kept under the org that entry resolved to (the last one).
+_PARENT_ORG_CONTRACTS = {
+    "UnitedHealth Group": [
+        "H0543", "H0754", "H1045", "H1685", "H2001", "H2168",
+        "H2406", "H3749", "H4091", "H5253", "H6501", "H7657",
+    ],
+    "CVS Health (Aetna)": [
+        "H0112", "H0318", "H0485", "H0533", "H1609", "H2478",
+        "H3152", "H3312", "H3597", "H4002", "H4448", "H5521",
+        "H9851",
+    ],
+    "Humana": [
+        "H0028", "H1036", "H1406", "H1951", "H2649", "H4141",
+        "H4461", "H5216", "H5619", "H6622", "H7495", "H8145",
+        "R5826",
+    ],
+    "Elevance Health (Anthem)": [
+        "H0146", "H0540", "H2006", "H3655", "H3905", "H4624",
+        "H5853", "H9019",
+    ],
+    "Centene": [
+        "H1485", "H2712", "H3447", "H4007", "H5427", "H6832",
+    ],
+    "Kaiser Permanente": [
+        "H0524", "H0630", "H2172", "H9003",
+    ],
+    "Cigna": [
+        "H0107", "H0354", "H4513", "H5410", "H6373",
+    ],
+    "Molina Healthcare": [
+        "H0169", "H0420", "H5823", "H9498",
+    ],
+    "BCBS": [
+        "H0404", "H0520", "H1350", "H2819", "H3949", "H5008",
+        "H6502",
+    ],
 }
 
-
-def identify_plan_type(contract_id: str, plan_name: str, org_type: str = "") -> str:
-    """
-    Identify plan type from contract ID and plan name.
-
-    Contract prefixes:
-    - H: HMO/Local MA
-    - R: Regional PPO
-    - S: Stand-alone PDP (not MA)
-    - E: Employer Group
-
-    DSNP identified via org type or plan name keywords.
-    PFFS and other minor types are grouped into "Other".
-    """
-    if not contract_id:
-        return "Other"
-
-    prefix = contract_id[0].upper()
-
-    # Check for DSNP first
-    dsnp_keywords = ["dsnp", "dual", "d-snp", "dual eligible", "dual-eligible"]
-    plan_name_lower = (plan_name or "").lower()
-    org_type_lower = (org_type or "").lower()
-
-    if any(kw in plan_name_lower or kw in org_type_lower for kw in dsnp_keywords):
-        return "DSNP"
-
-    # Determine base type from contract prefix
-    if prefix == "H":
-        # Could be HMO or PPO - check plan name for hints
-        if "ppo" in plan_name_lower:
-            return "PPO"
-        else:
-            return "HMO"
-    elif prefix == "R":
-        return "PPO"  # Regional PPO
-    else:
-        return "Other"
+PARENT_ORG_MAPPING = {
+    contract_id: org
+    for org, contract_ids in _PARENT_ORG_CONTRACTS.items()
+    for contract_id in contract_ids
+}
+assert len(PARENT_ORG_MAPPING) == sum(len(c) for c in _PARENT_ORG_CONTRACTS.values()), \
+    "Contract listed under more than one parent org in _PARENT_ORG_CONTRACTS"
+
+# DSNP keywords matched against plan name and org type
+DSNP_RE = re.compile(r'dsnp|dual|d-snp|dual eligible|dual-eligible', re.IGNORECASE)
+
+# Organization name keywords used when a contract isn't in PARENT_ORG_MAPPING
+ORG_KEYWORDS = {
+    "UnitedHealth Group": ["united", "uhc", "optum", "pacificare"],
+    "CVS Health (Aetna)": ["aetna", "cvs"],
+    "Humana": ["humana"],
+    "Elevance Health (Anthem)": ["anthem", "wellpoint", "elevance"],
+    "Centene": ["centene", "wellcare", "health net"],
+    "Kaiser Permanente": ["kaiser"],
+    "Cigna": ["cigna"],
+    "Molina Healthcare": ["molina"],
+    "BCBS": ["blue cross", "blue shield", "bcbs", "anthem"],
+}
+ORG_PATTERNS = {
+    parent: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for parent, keywords in ORG_KEYWORDS.items()
+}
 
 
 def get_parent_org(contract_id: str, org_name: str = "") -> str:
@@ -171,27 +115,33 @@ def get_parent_org(contract_id: str, org_name: str = "") -> str:
         return PARENT_ORG_MAPPING[contract_base]
 
     # Try to infer from organization name
-    org_name_lower = (org_name or "").lower()
-
-    org_keywords = {
-        "UnitedHealth Group": ["united", "uhc", "optum", "pacificare"],
-        "CVS Health (Aetna)": ["aetna", "cvs"],
-        "Humana": ["humana"],
-        "Elevance Health (Anthem)": ["anthem", "wellpoint", "elevance"],
-        "Centene": ["centene", "wellcare", "health net"],
-        "Kaiser Permanente": ["kaiser"],
-        "Cigna": ["cigna"],
-        "Molina Healthcare": ["molina"],
-        "BCBS": ["blue cross", "blue shield", "bcbs", "anthem"],
-    }
-
-    for parent, keywords in org_keywords.items():
-        if any(kw in org_name_lower for kw in keywords):
+    for parent, pattern in ORG_PATTERNS.items():
+        if pattern.search(org_name or ""):
             return parent
 
     return "Other"
 
 
+def sniff_encodings(csv_path: Path, encodings: list, sample_size: int = 65536) -> list:
+    """
+    Order candidate encodings so the one that decodes the first bytes of
+    the file comes first. The rest are kept as fallbacks in case a
+    non-decodable byte only appears past the sample.
+    """
+    with open(csv_path, 'rb') as f:
+        head = f.read(sample_size)
+
+    for encoding in encodings:
+        try:
+            # Incremental decode tolerates a multi-byte char cut off by the sample
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+        except UnicodeDecodeError:
+            continue
+        return [encoding] + [e for e in encodings if e != encoding]
+
+    return encodings
+
+
 def load_contract_info(csv_path: Path) -> tuple:
     """
     Load contract info file to get organization mappings and EGHP status.
@@ -220,11 +170,11 @@ def load_contract_info(csv_path: Path) -> tuple:
         contract_path = contract_files[0]
     print(f"Loading contract info from: {contract_path}")
 
-    # Try multiple encodings
+    # Try multiple encodings, starting with the one the file's bytes suggest
     encodings = ['utf-8', 'cp1252', 'latin-1']
     df = None
 
-    for encoding in encodings:
+    for encoding in sniff_encodings(contract_path, encodings):
         try:
             df = pd.read_csv(contract_path, dtype=str, encoding=encoding)
             break
@@ -270,20 +220,19 @@ def load_contract_info(csv_path: Path) -> tuple:
             break
 
     if parent_col and contract_col:
-        for _, row in df.iterrows():
-            contract = row[contract_col]
-            org = row[parent_col]
-            if pd.notna(contract) and pd.notna(org):
-                contract_info[contract] = {
-                    'parent_org': org,
-                }
-
-            # Build plan-level EGHP mapping
-            if plan_col and eghp_col:
-                plan_id = row[plan_col] if plan_col in row else None
-                eghp = row[eghp_col] if eghp_col in row else None
-                if pd.notna(contract) and pd.notna(plan_id) and pd.notna(eghp):
-                    plan_eghp[(contract, plan_id)] = eghp
+        orgs = df[[contract_col, parent_col]].dropna()
+        contract_info = {
+            contract: {'parent_org': org}
+            for contract, org in zip(orgs[contract_col].values, orgs[parent_col].values)
+        }
+
+        # Build plan-level EGHP mapping
+        if plan_col and eghp_col:
+            plans = df[[contract_col, plan_col, eghp_col]].dropna()
+            plan_eghp = dict(zip(
+                zip(plans[contract_col].values, plans[plan_col].values),
+                plans[eghp_col].values,
+            ))
 
     print(f"Loaded {len(contract_info)} contract info mappings")
     if eghp_col and plan_col:
@@ -319,19 +268,46 @@ def is_group_plan(contract_id: str, eghp: str) -> bool:
     return False
 
 
+def read_csv_as_str(csv_path: Path, encoding: str) -> pd.DataFrame:
+    """
+    Read a CSV with every column as strings, using the multi-threaded
+    PyArrow parser when available and the pandas parser otherwise.
+    """
+    if pa is not None:
+        # Declare every column as string up front so pyarrow doesn't infer
+        # numbers and strip leading zeros from IDs like plan_id or FIPS
+        columns = pd.read_csv(csv_path, nrows=0, encoding=encoding).columns
+        try:
+            table = pa_csv.read_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(encoding=encoding),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={col: pa.string() for col in columns},
+                    strings_can_be_null=True,
+                ),
+            )
+            return table.to_pandas()
+        except pa.ArrowInvalid as e:
+            if 'UTF8' in str(e):
+                raise UnicodeError(str(e)) from e
+            print(f"PyArrow could not parse CSV ({e}), falling back to pandas parser")
+
+    return pd.read_csv(csv_path, dtype=str, low_memory=False, encoding=encoding)
+
+
 def process_csv(csv_path: Path) -> pd.DataFrame:
     """
     Read and process the CMS CPSC CSV file.
     """
     print(f"Reading CSV: {csv_path}")
 
-    # CMS CSVs can have varying encodings - try multiple
+    # CMS CSVs can have varying encodings - sniff the likely one, then fall back
     encodings = ['utf-8', 'cp1252', 'latin-1', 'iso-8859-1']
     df = None
 
-    for encoding in encodings:
+    for encoding in sniff_encodings(csv_path, encodings):
         try:
-            df = pd.read_csv(csv_path, dtype=str, low_memory=False, encoding=encoding)
+            df = read_csv_as_str(csv_path, encoding)
             print(f"Successfully read with encoding: {encoding}")
             break
         except (UnicodeDecodeError, UnicodeError):
@@ -373,6 +349,9 @@ def process_csv(csv_path: Path) -> pd.DataFrame:
         print(f"Available columns: {list(df.columns)}")
         raise ValueError(f"Missing required columns: {missing}")
 
+    # Drop the raw CMS columns nothing downstream uses
+    df = df[[col for col in column_mappings if col in df.columns]].copy()
+
     # Clean enrollment data - handle both string and numeric types
     if df['enrollment'].dtype == 'object':
         df['enrollment'] = df['enrollment'].str.replace(',', '')
@@ -430,6 +409,10 @@ def process_csv(csv_path: Path) -> pd.DataFrame:
     group_count = df['is_group'].sum()
     print(f"Group plans: {group_count:,} records ({group_count/len(df)*100:.1f}%)")
 
+    # Categorical keys hash as integer codes in every downstream groupby
+    for col in ('state', 'contract_number'):
+        df[col] = df[col].astype('category')
+
     return df
 
 
@@ -438,26 +421,40 @@ def aggregate_enrollment(df: pd.DataFrame, data_year: int = None, data_month: in
     Aggregate enrollment data by county, organization, and plan type.
     """
     # Add derived columns
-    df['plan_type'] = df.apply(
-        lambda r: identify_plan_type(
-            r.get('contract_number', ''),
-            r.get('plan_name', ''),
-            r.get('org_type', '')
-        ),
-        axis=1
+    # Plan type from contract prefix and plan name:
+    # - DSNP: plan name or org type matches DSNP_RE (checked first)
+    # - H: HMO/Local MA, or PPO if the plan name mentions PPO
+    # - R: Regional PPO
+    # - E (employer group) and anything else: "Other"
+    contract_ids = df['contract_number'].astype(object).fillna('')
+    prefix = contract_ids.str[:1].str.upper()
+    plan_lower = df['plan_name'].fillna('').str.lower() if 'plan_name' in df.columns else pd.Series('', index=df.index)
+    org_type_lower = df['org_type'].fillna('').str.lower() if 'org_type' in df.columns else pd.Series('', index=df.index)
+
+    dsnp_mask = (
+        plan_lower.str.contains(DSNP_RE, na=False)
+        | org_type_lower.str.contains(DSNP_RE, na=False)
+    ) & (contract_ids != '')
+
+    df['plan_type'] = np.select(
+        [
+            dsnp_mask,
+            (prefix == 'H') & plan_lower.str.contains('ppo', regex=False, na=False),
+            prefix == 'H',
+            prefix == 'R',
+        ],
+        ['DSNP', 'PPO', 'HMO', 'PPO'],
+        default='Other',
     )
 
     # Use organization column directly (from contract info) as parent_org
     if 'organization' in df.columns:
         df['parent_org'] = df['organization']
     else:
-        df['parent_org'] = df.apply(
-            lambda r: get_parent_org(
-                r.get('contract_number', ''),
-                ''
-            ),
-            axis=1
-        )
+        df['parent_org'] = contract_ids.str[:5].map(PARENT_ORG_MAPPING).fillna('Other')
+
+    df['plan_type'] = df['plan_type'].astype('category')
+    df['parent_org'] = df['parent_org'].astype('category')
 
     # Build FIPS code if not present
     if 'fips' not in df.columns:
@@ -490,7 +487,18 @@ def aggregate_enrollment(df: pd.DataFrame, data_year: int = None, data_month: in
     }
 
     # County-level aggregation
-    county_group = df.groupby(['state', 'county'] if 'county' in df.columns else ['state'])
+    county_cols = ['state', 'county'] if 'county' in df.columns else ['state']
+    county_group = df.groupby(county_cols, observed=True)
+
+    # Cross-tabulate once for all counties rather than regrouping each county
+    # (int64 sums so to_dict() yields plain Python ints)
+    org_by_county = df.groupby(county_cols + ['parent_org'], observed=True)['enrollment'].sum().astype('int64')
+    plan_type_by_county = df.groupby(county_cols + ['plan_type'], observed=True)['enrollment'].sum().astype('int64')
+    contracts_by_county = df.groupby(county_cols + ['contract_number'], observed=True)['enrollment'].sum().astype('int64')
+
+    # First non-empty FIPS code per county, looked up inside the loop
+    has_fips = df['fips'].notna() & (df['fips'] != '')
+    fips_map = df.loc[has_fips].groupby(county_cols, observed=True)['fips'].first().to_dict()
 
     for keys, group in county_group:
         if isinstance(keys, tuple):
@@ -501,8 +509,7 @@ def aggregate_enrollment(df: pd.DataFrame, data_year: int = None, data_month: in
             county = "Unknown"
             county_key = f"{state}_unknown"
 
-        fips_values = group['fips'].dropna().unique()
-        fips = fips_values[0] if len(fips_values) > 0 and fips_values[0] else county_key
+        fips = fips_map.get((state, county) if len(county_cols) > 1 else state, county_key)
 
         # Aggregate by group/individual
         group_enrollment = int(group[group['is_group'] == True]['enrollment'].sum())
@@ -513,39 +520,33 @@ def aggregate_enrollment(df: pd.DataFrame, data_year: int = None, data_month: in
             'county': county,
             'fips': fips,
             'total': int(group['enrollment'].sum()),
-            'by_org': group.groupby('parent_org')['enrollment'].sum().to_dict(),
-            'by_plan_type': group.groupby('plan_type')['enrollment'].sum().to_dict(),
+            'by_org': org_by_county.loc[keys].to_dict(),
+            'by_plan_type': plan_type_by_county.loc[keys].to_dict(),
             'by_group': {
                 'group': group_enrollment,
                 'individual': individual_enrollment
             },
-            'contracts': group.groupby('contract_number')['enrollment'].sum().to_dict()
+            'contracts': contracts_by_county.loc[keys].to_dict()
         }
 
-        # Convert numpy int64 to Python int
-        county_data['by_org'] = {k: int(v) for k, v in county_data['by_org'].items()}
-        county_data['by_plan_type'] = {k: int(v) for k, v in county_data['by_plan_type'].items()}
-        county_data['contracts'] = {k: int(v) for k, v in county_data['contracts'].items()}
-
         result['counties'][fips] = county_data
 
     # Organization totals
-    org_totals = df.groupby('parent_org')['enrollment'].sum()
-    result['by_org'] = {k: int(v) for k, v in org_totals.to_dict().items()}
+    org_totals = df.groupby('parent_org', observed=True)['enrollment'].sum()
+    result['by_org'] = org_totals.astype('int64').to_dict()
 
     # Plan type totals
-    plan_type_totals = df.groupby('plan_type')['enrollment'].sum()
-    result['by_plan_type'] = {k: int(v) for k, v in plan_type_totals.to_dict().items()}
+    plan_type_totals = df.groupby('plan_type', observed=True)['enrollment'].sum()
+    result['by_plan_type'] = plan_type_totals.astype('int64').to_dict()
 
     # State totals
-    state_totals = df.groupby('state')['enrollment'].sum()
-    result['by_state'] = {k: int(v) for k, v in state_totals.to_dict().items()}
+    state_totals = df.groupby('state', observed=True)['enrollment'].sum()
+    result['by_state'] = state_totals.astype('int64').to_dict()
 
     # Contract details
     agg_dict = {
         'enrollment': 'sum',
         'parent_org': 'first',
-        'plan_type': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'Unknown',
         'is_group': 'any',  # True if any plan in the contract is a group plan
     }
 
@@ -553,18 +554,21 @@ def aggregate_enrollment(df: pd.DataFrame, data_year: int = None, data_month: in
     if 'organization' in df.columns:
         agg_dict['organization'] = 'first'
 
-    contract_details = df.groupby('contract_number').agg(agg_dict).to_dict('index')
+    contract_details = df.groupby('contract_number', observed=True).agg(agg_dict)
 
-    result['contracts'] = {
-        k: {
-            'enrollment': int(v['enrollment']),
-            'parent_org': v['parent_org'],
-            'organization': v.get('organization', v['parent_org']),
-            'plan_type': v['plan_type'],
-            'is_group': bool(v['is_group']),
-        }
-        for k, v in contract_details.items()
-    }
+    # Most common plan type per contract (ties go to the first alphabetically)
+    plan_type_counts = df.groupby(['contract_number', 'plan_type'], observed=True).size()
+    top_plan_type = plan_type_counts.groupby(level=0, observed=True).idxmax().map(lambda t: t[1])
+    contract_details['plan_type'] = top_plan_type.reindex(contract_details.index).fillna('Unknown')
+
+    contract_details['enrollment'] = contract_details['enrollment'].astype('int64')
+    contract_details['is_group'] = contract_details['is_group'].astype(bool)
+    if 'organization' not in contract_details.columns:
+        contract_details['organization'] = contract_details['parent_org']
+
+    result['contracts'] = contract_details[
+        ['enrollment', 'parent_org', 'organization', 'plan_type', 'is_group']
+    ].to_dict('index')
 
     return result
 
@@ -572,6 +576,10 @@ def aggregate_enrollment(df: pd.DataFrame, data_year: int = None, data_month: in
 def calculate_changes(current: dict, december: dict) -> dict:
     """
     Calculate enrollment changes between current and December baseline.
+
+    Records carry only the change, except counties also keep the December
+    total from the baseline actually compared against (the generic
+    enrollment-december.json the dashboard loads can be a different year).
     """
     changes = {
         'counties': {},
@@ -600,7 +608,6 @@ def calculate_changes(current: dict, december: dict) -> dict:
         change_pct = round((change / dec_total * 100), 2) if dec_total > 0 else 0
 
         changes['counties'][fips] = {
-            'current': curr_total,
             'december': dec_total,
             'change': change,
             'change_pct': change_pct,
@@ -613,8 +620,6 @@ def calculate_changes(current: dict, december: dict) -> dict:
         change_pct = round((change / dec_total * 100), 2) if dec_total > 0 else 0
 
         changes['by_org'][org] = {
-            'current': curr_total,
-            'december': dec_total,
             'change': change,
             'change_pct': change_pct,
         }
@@ -626,8 +631,6 @@ def calculate_changes(current: dict, december: dict) -> dict:
         change_pct = round((change / dec_total * 100), 2) if dec_total > 0 else 0
 
         changes['by_state'][state] = {
-            'current': curr_total,
-            'december': dec_total,
             'change': change,
             'change_pct': change_pct,
         }
@@ -638,8 +641,15 @@ def calculate_changes(current: dict, december: dict) -> dict:
 def save_json(data: dict, output_path: Path):
     """Save data to JSON file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(data, f, indent=2)
     print(f"Saved: {output_path}")
 
 